@@ -12,11 +12,10 @@ Run:
 """
 
 import os
-import json
 from crewai import Agent, Task, Crew, Process
 
 # ── Custos setup (3 lines) ────────────────────────────────────────────────────
-from custos_sdk import Custos
+from custos_sdk import Custos, truncate_summary
 custos = Custos(private_key=os.getenv("AGENT_KEY"), agent_id=1)
 # ─────────────────────────────────────────────────────────────────────────────
 
@@ -45,10 +44,25 @@ analyst = Agent(
 
 # ── Tasks ─────────────────────────────────────────────────────────────────────
 
+def inscribe_task(output):
+    """
+    Per-task proof-of-work, fire-and-forget: the tx is submitted on the SDK's
+    background loop so inscription overlaps the next task's LLM call instead
+    of blocking the crew for block-confirmation time.
+    """
+    raw = output.raw if hasattr(output, "raw") else str(output)
+    custos.fire_and_forget(
+        block="research",
+        summary=truncate_summary(raw),
+        content={"task": getattr(output, "description", ""), "output": raw},
+    )
+
+
 research_task = Task(
     description="Identify the top 3 AI agent frameworks that lack on-chain proof-of-work.",
     expected_output="List of 3 frameworks with gap analysis.",
     agent=researcher,
+    callback=inscribe_task,
 )
 
 analysis_task = Task(
@@ -56,6 +70,7 @@ analysis_task = Task(
     expected_output="A 2-sentence positioning statement.",
     agent=analyst,
     context=[research_task],
+    callback=inscribe_task,
 )
 
 
@@ -70,14 +85,14 @@ crew = Crew(
 
 output = crew.kickoff()
 
-# Inscribe after crew completes
+# Inscribe the full crew output after completion (blocking — final record)
 raw = output.raw if hasattr(output, "raw") else str(output)
-summary = raw[:140]
-content = json.dumps({
+summary = truncate_summary(raw)  # 140 bytes, safe at UTF-8 boundaries
+content = {  # dicts are serialized by the SDK (orjson when installed)
     "crew": "ai-accountability-research",
     "tasks": 2,
     "output": raw,
-})
+}
 
 result = custos.inscribe_sync(block="research", summary=summary, content=content)
 
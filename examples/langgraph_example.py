@@ -12,7 +12,6 @@ Run:
 """
 
 import os
-import json
 from typing import TypedDict, Annotated
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
@@ -20,7 +19,7 @@ from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage
 
 # ── Custos setup (3 lines) ────────────────────────────────────────────────────
-from custos_sdk import Custos
+from custos_sdk import Custos, truncate_summary
 custos = Custos(private_key=os.getenv("AGENT_KEY"), agent_id=1)
 # ─────────────────────────────────────────────────────────────────────────────
 
@@ -42,25 +41,24 @@ def research_node(state: AgentState) -> AgentState:
 
 def inscribe_node(state: AgentState) -> AgentState:
     """
-    Inscribe this cycle's work onchain.
-    Runs after every research step — tamper-evident proof of what the agent did.
+    Queue this cycle's inscription and return immediately.
+    The tx submits and confirms on the SDK's background loop, so the graph
+    keeps progressing while the chain catches up.
     """
-    summary = state["result"][:140]  # max 140 chars for activity feed
-    content = json.dumps({
+    summary = truncate_summary(state["result"])  # max 140 bytes for activity feed
+    content = {  # dicts are serialized by the SDK (orjson when installed)
         "task": state["task"],
         "result": state["result"],
         "messages": len(state["messages"]),
-    })
+    }
 
-    result = custos.inscribe_sync(
+    custos.fire_and_forget(
         block="research",
         summary=summary,
         content=content,
     )
 
-    print(f"✓ Inscribed onchain: {result.tx_hash}")
-    print(f"  proofHash: {result.proof_hash}")
-    print(f"  network cycle: {result.network_cycle}")
+    print("✓ Inscription queued — confirming in background")
 
     return state
 
@@ -12,12 +12,11 @@ Run:
 """
 
 import os
-import json
 import asyncio
 from agents import Agent, Runner
 
 # ── Custos setup (3 lines) ────────────────────────────────────────────────────
-from custos_sdk import Custos
+from custos_sdk import Custos, truncate_summary
 custos = Custos(private_key=os.getenv("AGENT_KEY"), agent_id=1)
 # ─────────────────────────────────────────────────────────────────────────────
 
@@ -40,20 +39,21 @@ async def run_with_proof(task: str) -> dict:
     output = result.final_output
 
     # Inscribe — tamper-evident proof of what the agent produced
-    summary = output[:140]
-    content = json.dumps({
+    summary = truncate_summary(output)  # 140 bytes, safe at UTF-8 boundaries
+    content = {  # dicts are serialized by the SDK (orjson when installed)
         "agent": agent.name,
         "task": task,
         "output": output,
         "input_tokens": getattr(result, "input_tokens", None),
         "output_tokens": getattr(result, "output_tokens", None),
-    })
+    }
 
     proof = await custos.inscribe(
         block="research",
         summary=summary,
         content=content,
     )
+    await proof.wait()  # inscribe() returns at submission; wait for the cycle id
 
     print(f"✓ Agent output inscribed onchain")
     print(f"  tx:        {proof.tx_hash}")
@@ -15,7 +15,27 @@ Example:
     print(result["tx_hash"])
 """
 
-from .client import Custos, InscribeResult, AttestResult
+from .client import (
+    Block,
+    Custos,
+    InscribeResult,
+    AttestResult,
+    MerkleInscribeResult,
+    merkleize,
+    stream_json,
+    truncate_summary,
+    verify_merkle_proof,
+)
 
-__all__ = ["Custos", "InscribeResult", "AttestResult"]
+__all__ = [
+    "Block",
+    "Custos",
+    "InscribeResult",
+    "AttestResult",
+    "MerkleInscribeResult",
+    "merkleize",
+    "stream_json",
+    "truncate_summary",
+    "verify_merkle_proof",
+]
 __version__ = "0.1.0"
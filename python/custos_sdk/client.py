@@ -6,81 +6,398 @@ Wraps CustosNetworkProxy (0x9B5FD0B02355E954F159F33D7886e4198ee777b9) on Base ma
 from __future__ import annotations
 
 import asyncio
-import hashlib
+import atexit
+import itertools
 import json
+import logging
+import os
+import threading
 import time
-from dataclasses import dataclass
-from typing import Literal
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Iterable, Iterator, Literal, Optional, Union
 
 # web3.py is the dependency — lightweight, widely available in agent envs
 try:
-    from web3 import AsyncWeb3
+    import aiohttp
+    import rlp
+    from hexbytes import HexBytes
+    from web3 import AsyncHTTPProvider, AsyncWeb3, WebSocketProvider
+    from web3._utils.encoding import Web3JsonEncoder
+    from web3.exceptions import TransactionNotFound, Web3RPCError
+    from web3.logs import DISCARD
+    from eth_abi import encode as abi_encode
     from eth_account import Account
+    from eth_hash.auto import keccak
+    from eth_keys import keys as eth_keys
+    from eth_utils import function_signature_to_4byte_selector
 except ImportError as e:
     raise ImportError(
         "custos_sdk requires web3.py: pip install web3 eth-account"
     ) from e
 
+# Optional — HTTP/2 multiplexing for concurrent JSON-RPC calls
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional — 2-10x faster JSON, and it returns bytes directly (no .encode copy)
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    orjson = None
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
+
+# Optional — C keccak whose hot loop releases the GIL, so big Merkle leaf
+# batches can fan out across cores (pip install pycryptodome)
+try:
+    from Crypto.Hash import keccak as _pc_keccak
+except ImportError:
+    _pc_keccak = None
+
+logger = logging.getLogger(__name__)
+
 # ─── Constants ────────────────────────────────────────────────────────────────
 
 PROXY_ADDRESS = "0x9B5FD0B02355E954F159F33D7886e4198ee777b9"
 DEFAULT_RPC   = "https://mainnet.base.org"
 
-BLOCK_TYPE_MAP: dict[str, int] = {
-    "build":      0,
-    "research":   1,
-    "market":     2,
-    "system":     3,
-    "governance": 4,
-}
-
-# Minimal ABI — only what we call
-PROXY_ABI = json.loads("""[
-  {
-    "name": "inscribeCycle",
-    "type": "function",
-    "stateMutability": "nonpayable",
-    "inputs": [
-      {"name": "blockType",   "type": "uint8"},
-      {"name": "summary",     "type": "string"},
-      {"name": "contentHash", "type": "bytes32"}
-    ],
-    "outputs": [
-      {"name": "cycleId",   "type": "uint256"},
-      {"name": "proofHash", "type": "bytes32"}
-    ]
-  },
-  {
-    "name": "attestProof",
-    "type": "function",
-    "stateMutability": "nonpayable",
-    "inputs": [
-      {"name": "agentId",   "type": "uint256"},
-      {"name": "proofHash", "type": "bytes32"},
-      {"name": "valid",     "type": "bool"}
-    ],
-    "outputs": []
-  },
-  {
-    "name": "totalCycles",
-    "type": "function",
-    "stateMutability": "view",
-    "inputs": [],
-    "outputs": [{"name": "", "type": "uint256"}]
-  }
-]""")
+class Block(IntEnum):
+    """On-chain block types accepted by inscribeCycle."""
+    build      = 0
+    research   = 1
+    market     = 2
+    system     = 3
+    governance = 4
+
+# How long a fetched base fee stays fresh — one Base block
+BASE_FEE_TTL = 12.0
+
+# Default priority fee — 1 gwei is ample on Base
+DEFAULT_PRIORITY_FEE_GWEI = 1.0
+
+# Calldata layouts — fixed by the contract, parsed once at import
+_INSCRIBE_TYPES = ("uint8", "string", "bytes32")
+_ATTEST_TYPES   = ("uint256", "bytes32", "bool")
+
+# Minimal ABI — only what we call. A plain literal: nothing to parse at
+# import time, and the hot tx path never consults it (selectors are
+# precomputed; it only backs event decoding and totalCycles)
+PROXY_ABI = [
+    {
+        "name": "inscribeCycle",
+        "type": "function",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "blockType",   "type": "uint8"},
+            {"name": "summary",     "type": "string"},
+            {"name": "contentHash", "type": "bytes32"},
+        ],
+        "outputs": [
+            {"name": "cycleId",   "type": "uint256"},
+            {"name": "proofHash", "type": "bytes32"},
+        ],
+    },
+    {
+        "name": "attestProof",
+        "type": "function",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "agentId",   "type": "uint256"},
+            {"name": "proofHash", "type": "bytes32"},
+            {"name": "valid",     "type": "bool"},
+        ],
+        "outputs": [],
+    },
+    {
+        "name": "totalCycles",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256"}],
+    },
+    {
+        "name": "CycleInscribed",
+        "type": "event",
+        "anonymous": False,
+        "inputs": [
+            {"name": "cycleId",      "type": "uint256", "indexed": False},
+            {"name": "proofHash",    "type": "bytes32", "indexed": False},
+            {"name": "networkCycle", "type": "uint256", "indexed": False},
+        ],
+    },
+]
 
 BlockType = Literal["build", "research", "market", "system", "governance"]
 
+# inscribe() takes the name, the enum, or the raw uint8 — ints skip the lookup
+BlockInput = Union[BlockType, Block, int]
+
+
+def _block_value(block: BlockInput) -> int:
+    if isinstance(block, int):  # covers Block too — IntEnum
+        return int(block)
+    try:
+        return Block[block].value
+    except KeyError:
+        raise ValueError(
+            f"unknown block type {block!r} — expected one of: "
+            + ", ".join(Block.__members__)
+        ) from None
+
+
+# Anything hashable as cycle content: full payload, a dict (serialized with
+# orjson when installed), or a stream of byte chunks
+Content = Union[str, bytes, dict, Iterable[bytes]]
+
+# Encode str content in slices this large so multi-MB payloads never need a
+# second full-size buffer
+_ENCODE_CHUNK = 64 * 1024
+
+# On-chain summary limit — UTF-8 bytes, not code points
+SUMMARY_MAX_BYTES = 140
+
+
+def truncate_summary(raw: str) -> str:
+    """
+    Trim ``raw`` to fit the 140-byte on-chain summary limit, cutting at a
+    UTF-8 boundary so multi-byte characters are never split.
+    """
+    return raw.encode("utf-8")[:SUMMARY_MAX_BYTES].decode("utf-8", errors="ignore")
+
+
+def stream_json(obj: object) -> Iterator[bytes]:
+    """
+    Yield ``obj`` as JSON byte chunks without materialising the full string.
+
+    Pass the generator straight to ``inscribe(content=...)``::
+
+        custos.inscribe(block="research", summary=s,
+                        content=stream_json({"task": task, "output": raw}))
+    """
+    for chunk in json.JSONEncoder().iterencode(obj):
+        yield chunk.encode()
+
+
+def _hash_and_summary(content_obj: object) -> tuple[bytes, str]:
+    """
+    Serialize, hash, and summarise in one fused pass: each JSON chunk feeds
+    the keccak hasher while the first 140 bytes accumulate into the summary.
+    No full-payload intermediate copies beyond the serializer's own output.
+
+    Matches _hash_content for dict input (same serializer), so the digest is
+    identical whether or not the summary is derived.
+    """
+    hasher = keccak.new(b"")
+    head = bytearray()
+    if orjson is not None:
+        # orjson emits one buffer — hash it whole, summary from its head
+        payload = _dumps(content_obj)
+        hasher.update(payload)
+        head += payload[:SUMMARY_MAX_BYTES]
+    else:
+        for chunk in stream_json(content_obj):
+            hasher.update(chunk)
+            if len(head) < SUMMARY_MAX_BYTES:
+                head += chunk[: SUMMARY_MAX_BYTES - len(head)]
+    return hasher.digest(), head.decode("utf-8", errors="ignore")
+
+
+# Fan leaf hashing out to threads above this batch size, in blocks this big
+_PARALLEL_LEAVES = 1024
+_LEAF_CHUNK      = 1024
+
+
+def _hash_leaves(leaves: list[bytes]) -> bytearray:
+    """Flat slab of keccak(leaf) digests; large batches fan out across cores."""
+    if _pc_keccak is None or len(leaves) < _PARALLEL_LEAVES:
+        slab = bytearray()
+        for leaf in leaves:
+            slab += keccak(leaf)
+        return slab
+
+    def _hash_block(block: list[bytes]) -> bytes:
+        out = bytearray(len(block) * 32)
+        for k, leaf in enumerate(block):
+            out[k * 32 : k * 32 + 32] = _pc_keccak.new(digest_bits=256, data=leaf).digest()
+        return bytes(out)
+
+    blocks = [leaves[i : i + _LEAF_CHUNK] for i in range(0, len(leaves), _LEAF_CHUNK)]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return bytearray(b"".join(pool.map(_hash_block, blocks)))
+
+
+def merkleize(leaves: list[bytes]) -> tuple[bytes, list[list[bytes]]]:
+    """
+    Build a binary keccak Merkle tree over ``leaves`` (each leaf is hashed
+    first; the last node is duplicated on odd levels).
+
+    Returns ``(root, proofs)`` where ``proofs[i]`` is the bottom-up list of
+    sibling hashes proving leaf ``i`` against the root. Levels are kept as
+    flat bytearray slabs — no per-node Python objects.
+    """
+    if not leaves:
+        raise ValueError("merkleize requires at least one leaf")
+
+    slab = _hash_leaves(leaves)
+    n = len(leaves)
+    proofs: list[list[bytes]] = [[] for _ in range(n)]
+    pos = list(range(n))
+
+    while n > 1:
+        if n % 2:
+            slab += slab[-32:]  # duplicate last node
+            n += 1
+        for i, p in enumerate(pos):
+            sib = p ^ 1
+            proofs[i].append(bytes(slab[sib * 32 : sib * 32 + 32]))
+            pos[i] = p >> 1
+        nxt = bytearray((n >> 1) * 32)
+        for j in range(0, n, 2):
+            nxt[(j >> 1) * 32 : (j >> 1) * 32 + 32] = keccak(slab[j * 32 : j * 32 + 64])
+        slab = nxt
+        n >>= 1
+
+    return bytes(slab), proofs
+
+
+def verify_merkle_proof(leaf: bytes, proof: list[bytes], root: bytes, index: int) -> bool:
+    """Check a merkleize() proof: leaf at ``index`` hashes up to ``root``."""
+    node = keccak(leaf)
+    for sib in proof:
+        node = keccak(node + sib) if index % 2 == 0 else keccak(sib + node)
+        index >>= 1
+    return node == root
+
+
+def _hash_content(content: Content) -> bytes:
+    """keccak256 of the content, fed incrementally — one pass, no full copy."""
+    if isinstance(content, dict):
+        return keccak(_dumps(content))
+    if isinstance(content, bytes):
+        return keccak(content)
+    hasher = keccak.new(b"")
+    if isinstance(content, str):
+        for i in range(0, len(content), _ENCODE_CHUNK):
+            hasher.update(content[i : i + _ENCODE_CHUNK].encode())
+    else:
+        for chunk in content:
+            hasher.update(chunk)
+    return hasher.digest()
+
+
+# ─── HTTP/2 provider (optional) ───────────────────────────────────────────────
+
+class _HTTP2Provider(AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider variant that speaks JSON-RPC over a shared httpx HTTP/2
+    client. Calls issued concurrently (parallel receipt polls, cache refills)
+    are coalesced into a single JSON-RPC 2.0 batch POST and multiplexed over
+    one stream instead of racing for TCP connections.
+
+    Used automatically when ``httpx`` is installed (``pip install
+    custos-network-sdk[http2]``).
+    """
+
+    _clients: dict[int, "httpx.AsyncClient"] = {}
+
+    def __init__(self, endpoint_uri: str) -> None:
+        super().__init__(endpoint_uri)
+        self._ids = itertools.count(1)
+        # Futures and tasks are loop-bound — coalesce per loop so a flusher on
+        # one loop never tries to resolve futures created on another
+        self._outboxes: dict[int, list[tuple[dict, asyncio.Future]]] = {}
+        self._flushers: dict[int, asyncio.Task] = {}
+
+    @classmethod
+    def _get_client(cls) -> "httpx.AsyncClient":
+        # httpx clients hold loop-bound locks, so cache one per running loop
+        # (same keying web3 uses for its aiohttp session cache)
+        key = id(asyncio.get_running_loop())
+        client = cls._clients.get(key)
+        if client is None or client.is_closed:
+            limits = httpx.Limits(max_connections=16, keepalive_expiry=60)
+            try:
+                client = httpx.AsyncClient(http2=True, limits=limits)
+            except ImportError:  # h2 not installed — still get keep-alive reuse
+                client = httpx.AsyncClient(limits=limits)
+            cls._clients[key] = client
+        return client
+
+    async def make_request(self, method, params):
+        envelope = {
+            "jsonrpc": "2.0",
+            "method":  method,
+            "params":  params,
+            "id":      next(self._ids),
+        }
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future = loop.create_future()
+        outbox = self._outboxes.setdefault(id(loop), [])
+        outbox.append((envelope, fut))
+        flusher = self._flushers.get(id(loop))
+        if flusher is None or flusher.done():
+            self._flushers[id(loop)] = loop.create_task(self._flush(outbox))
+        return await fut
+
+    async def _flush(self, pending: list[tuple[dict, asyncio.Future]]) -> None:
+        # Loop until the outbox is empty: requests enqueued while a POST is in
+        # flight see a not-done flusher and rely on this task to drain them.
+        while pending:
+            await asyncio.sleep(0)  # yield once so concurrent callers join this batch
+            outbox, pending[:] = pending[:], []
+            envelopes = [env for env, _ in outbox]
+            payload   = envelopes[0] if len(envelopes) == 1 else envelopes
+            try:
+                resp = await self._get_client().post(
+                    str(self.endpoint_uri),
+                    content=json.dumps(payload, cls=Web3JsonEncoder).encode(),
+                    headers={"Content-Type": "application/json"},
+                )
+                body = resp.json()
+            except Exception as e:
+                for _, fut in outbox:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            responses = body if isinstance(body, list) else [body]
+            by_id = {r.get("id"): r for r in responses}
+            for env, fut in outbox:
+                if not fut.done():
+                    fut.set_result(by_id.get(env["id"], responses[0]))
+
 
 # ─── Result types ─────────────────────────────────────────────────────────────
 
 @dataclass
 class InscribeResult:
+    """
+    Result of an inscribe. Returned as soon as the tx is submitted — while
+    ``pending`` is True, ``cycle_id``/``network_cycle`` are not yet known.
+    ``await result.wait()`` to block until the tx is mined and both are filled.
+    If background confirmation fails, ``error`` holds the exception (and
+    ``pending`` stays True); ``wait()`` re-raises it.
+    """
     tx_hash:      str
     proof_hash:   str
-    cycle_id:     int
-    network_cycle: int
+    cycle_id:     Optional[int] = None
+    network_cycle: Optional[int] = None
+    pending:      bool = True
+    error:        Optional[Exception] = None
+    _confirm:     Optional["asyncio.Task"] = field(default=None, repr=False, compare=False)
+
+    async def wait(self) -> "InscribeResult":
+        """Await on-chain confirmation; returns self with cycle fields populated."""
+        if self._confirm is not None:
+            await self._confirm
+        if self.error is not None:
+            raise self.error
+        return self
 
 
 @dataclass
@@ -88,6 +405,18 @@ class AttestResult:
     tx_hash: str
 
 
+@dataclass
+class MerkleInscribeResult:
+    """
+    One on-chain tx covering N cycle contents. ``proofs[i]`` proves leaf i
+    against ``root`` (the inscribed contentHash) — publish them off-chain
+    alongside the leaves; verify with verify_merkle_proof().
+    """
+    root:        str                # 0x-hex Merkle root, == inscription.proof_hash
+    proofs:      list[list[bytes]]
+    inscription: InscribeResult
+
+
 # ─── Client ───────────────────────────────────────────────────────────────────
 
 class Custos:
@@ -99,6 +428,9 @@ class Custos:
         agent_id:    CustosNetwork agent ID (default: 1).
         proxy_address: Override proxy contract address.
         rpc_url:     Override RPC URL (default: Base mainnet public).
+        priority_fee_gwei: EIP-1559 priority fee per gas (default: 1 gwei).
+        ws_url:      Optional WebSocket RPC URL — when set, receipts arrive
+                     via a newHeads subscription instead of HTTP polling.
 
     Example::
 
@@ -123,94 +455,462 @@ class Custos:
         agent_id: int = 1,
         proxy_address: str = PROXY_ADDRESS,
         rpc_url: str = DEFAULT_RPC,
+        priority_fee_gwei: float = DEFAULT_PRIORITY_FEE_GWEI,
+        ws_url: Optional[str] = None,
     ) -> None:
         pk = private_key if private_key.startswith("0x") else f"0x{private_key}"
         self._account   = Account.from_key(pk)
+        # Raw key for the fast signing path — eth_keys picks a C-backed
+        # secp256k1 backend automatically when coincurve is installed
+        self._pk        = eth_keys.PrivateKey(bytes.fromhex(pk[2:]))
+        # Constant tx fields, prebound for _pack_and_sign
+        self._to_bytes  = bytes.fromhex(proxy_address.removeprefix("0x"))
         self._agent_id  = agent_id
         self._proxy     = proxy_address
-        self._w3        = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+        provider        = (_HTTP2Provider if httpx is not None else AsyncHTTPProvider)(rpc_url)
+        self._w3        = AsyncWeb3(provider)
         self._contract  = self._w3.eth.contract(
             address=AsyncWeb3.to_checksum_address(proxy_address),
             abi=PROXY_ABI,
         )
+        # Precomputed selectors — tx data is selector + abi_encode, with no
+        # per-call walk of the JSON ABI
+        self._sel_inscribe = function_signature_to_4byte_selector(
+            "inscribeCycle(uint8,string,bytes32)"
+        )
+        self._sel_attest = function_signature_to_4byte_selector(
+            "attestProof(uint256,bytes32,bool)"
+        )
+        # Lazily-filled, session-constant values (one RPC each, ever)
+        self._chain_id: int | None = None
+        self._gas_limit: int | None = None
+        # Mutable per-session caches — see _next_nonce()/_current_fees()
+        self._nonce: int | None = None
+        self._tip: int = int(priority_fee_gwei * 1e9)
+        self._base_fee: int = 0
+        self._base_fee_ts: float = 0.0
+        # Persistent loop for the *_sync wrappers — keeps the aiohttp pool warm
+        # across calls instead of paying TLS setup on every asyncio.run()
+        self._session: aiohttp.ClientSession | None = None
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="custos-sdk", daemon=True
+        )
+        self._loop_thread.start()
+        # Strong refs to in-flight confirmation tasks — prevents GC mid-poll
+        self._pending: set[asyncio.Task] = set()
+        # WebSocket receipt watcher — one newHeads subscription multiplexes
+        # every in-flight tx (only used when ws_url is given)
+        self._ws_url = ws_url
+        self._ws: AsyncWeb3 | None = None
+        self._receipt_futures: dict[bytes, asyncio.Future] = {}
+        self._watcher: asyncio.Task | None = None
+        atexit.register(self._shutdown)
+
+    def _shutdown(self) -> None:
+        """Close the shared session and stop the background loop (atexit)."""
+        if self._loop.is_closed():
+            return
+
+        async def _close() -> None:
+            if self._session is not None and not self._session.closed:
+                await self._session.close()
+            if self._ws is not None:
+                await self._ws.provider.disconnect()
+            for task in asyncio.all_tasks():
+                if task is not asyncio.current_task():
+                    task.cancel()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_close(), self._loop).result(timeout=5)
+        except Exception:
+            pass  # best-effort — interpreter is going down anyway
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=5)
+        self._loop.close()
+
+    async def _ensure_session(self) -> None:
+        """
+        Bind one keep-alive aiohttp session to the provider, scoped to the
+        background loop. aiohttp sessions are loop-bound, so callers awaiting
+        us on their own loop (direct async use) get web3's per-loop session
+        cache instead of sharing ours across loops.
+        """
+        if isinstance(self._w3.provider, _HTTP2Provider):
+            return  # httpx manages its own per-loop keep-alive pool
+        if asyncio.get_running_loop() is not self._loop:
+            return
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+            await self._w3.provider.cache_async_session(self._session)
+
+    # ── RPC caches ─────────────────────────────────────────────────────────────
+
+    def invalidate_cache(self) -> None:
+        """Drop cached nonce/base fee — call after an out-of-band tx or error."""
+        self._nonce = None
+        self._base_fee_ts = 0.0
+
+    async def _next_nonce(self, count: int = 1) -> int:
+        """Reserve ``count`` sequential nonces, fetching from the RPC only once per session."""
+        if self._nonce is None:
+            self._nonce = await self._w3.eth.get_transaction_count(self._account.address)
+        nonce = self._nonce
+        self._nonce += count  # optimistic — resynced on "nonce too low"
+        return nonce
+
+    async def _current_fees(self) -> tuple[int, int]:
+        """(maxFeePerGas, maxPriorityFeePerGas) — base fee cached for one block."""
+        if time.monotonic() - self._base_fee_ts > BASE_FEE_TTL:
+            pending = await self._w3.eth.get_block("pending")
+            self._base_fee = pending["baseFeePerGas"]
+            self._base_fee_ts = time.monotonic()
+        return self._base_fee * 2 + self._tip, self._tip
+
+    async def _get_chain_id(self) -> int:
+        if self._chain_id is None:
+            self._chain_id = await self._w3.eth.chain_id
+        return self._chain_id
+
+    async def _wait_for_receipt(self, tx_hash: bytes) -> dict:
+        """
+        Wait for a tx receipt — one WebSocket push per new head when ws_url is
+        configured, classic HTTP polling otherwise.
+        """
+        if self._ws_url is None:
+            return await self._w3.eth.wait_for_transaction_receipt(tx_hash)
+
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future = loop.create_future()
+        self._receipt_futures[tx_hash] = fut
+        if self._watcher is None or self._watcher.done():
+            self._watcher = loop.create_task(self._watch_heads())
+            self._pending.add(self._watcher)
+            self._watcher.add_done_callback(self._pending.discard)
+        return await fut
+
+    async def _watch_heads(self) -> None:
+        """Check all pending receipt futures on each new head; exit when drained."""
+        try:
+            if self._ws is None:
+                self._ws = AsyncWeb3(WebSocketProvider(self._ws_url))
+                await self._ws.provider.connect()
+            while self._receipt_futures:
+                sub_id = await self._ws.eth.subscribe("newHeads")
+                try:
+                    async for _ in self._ws.socket.process_subscriptions():
+                        for tx_hash, fut in list(self._receipt_futures.items()):
+                            try:
+                                receipt = await self._ws.eth.get_transaction_receipt(tx_hash)
+                            except TransactionNotFound:
+                                continue
+                            del self._receipt_futures[tx_hash]
+                            if not fut.done():
+                                fut.set_result(receipt)
+                        if not self._receipt_futures:
+                            break
+                finally:
+                    await self._ws.eth.unsubscribe(sub_id)
+                # Futures registered while unsubscribe was awaited still see this
+                # task as not done, so nothing respawns the watcher — loop back
+                # and resubscribe for them instead of returning.
+        except Exception:
+            # WS trouble — fall back to HTTP polling for whatever is left.
+            # A failure here (TimeExhausted, transport error) must reach the
+            # waiter: a future left unresolved hangs its caller forever.
+            for tx_hash, fut in list(self._receipt_futures.items()):
+                del self._receipt_futures[tx_hash]
+                if fut.done():
+                    continue
+                try:
+                    fut.set_result(
+                        await self._w3.eth.wait_for_transaction_receipt(tx_hash)
+                    )
+                except Exception as e:
+                    fut.set_exception(e)
+
+    def _pack_and_sign(self, nonce: int, max_fee: int, max_tip: int, gas: int, data: bytes) -> bytes:
+        """
+        Serialize and sign a type-2 tx directly: one rlp.encode over the field
+        list (session-constant chainId/to/value prebound), keccak, one eth_keys
+        signature. Byte-identical to Account.sign_transaction with none of its
+        per-call dict canonicalisation.
+        """
+        fields = [self._chain_id, nonce, max_tip, max_fee, gas, self._to_bytes, 0, data, []]
+        sig = self._pk.sign_msg_hash(keccak(b"\x02" + rlp.encode(fields)))
+        return b"\x02" + rlp.encode(fields + [sig.v, sig.r, sig.s])
 
     # ── Async API ──────────────────────────────────────────────────────────────
 
     async def inscribe(
         self,
-        block:   BlockType,
-        summary: str,
-        content: str,
+        block:   BlockInput,
+        summary: Optional[str],
+        content: Content,
     ) -> InscribeResult:
         """Inscribe a proof-of-work cycle onchain."""
-        if len(summary) > 140:
-            raise ValueError(f"summary must be ≤140 chars (got {len(summary)})")
-
-        block_type   = BLOCK_TYPE_MAP[block]
-        content_hash = bytes.fromhex(
-            hashlib.sha256(content.encode()).hexdigest()  # keccak would need eth_hash
-        )[:32]
-
-        nonce    = await self._w3.eth.get_transaction_count(self._account.address)
-        gas_price = await self._w3.eth.gas_price
-
-        tx = await self._contract.functions.inscribeCycle(
-            block_type, summary, content_hash
-        ).build_transaction({
-            "from":     self._account.address,
-            "nonce":    nonce,
-            "gasPrice": gas_price,
-        })
-
-        signed  = self._account.sign_transaction(tx)
-        tx_hash = await self._w3.eth.send_raw_transaction(signed.raw_transaction)
-        receipt = await self._w3.eth.wait_for_transaction_receipt(tx_hash)
+        results = await self.inscribe_many([(block, summary, content)])
+        return results[0]
 
-        network_cycle = await self._contract.functions.totalCycles().call()
-
-        return InscribeResult(
-            tx_hash=tx_hash.hex(),
-            proof_hash="0x" + content_hash.hex(),  # approximation; real value in event log
-            cycle_id=receipt["blockNumber"],
-            network_cycle=network_cycle,
+    async def inscribe_many(
+        self,
+        items: list[tuple[BlockInput, Optional[str], Content]],
+    ) -> list[InscribeResult]:
+        """
+        Inscribe several cycles in one shot.
+
+        Fetches nonce/gas price once, signs every tx locally, submits all of
+        them in a single JSON-RPC batch, then polls receipts in parallel —
+        O(1) round-trips on the submission path instead of O(N).
+
+        Args:
+            items: list of ``(block, summary, content)`` tuples. A summary of
+                None is derived from the content — the first 140 bytes of the
+                serialized JSON for dicts, of the text/bytes otherwise. Chunk
+                iterables are consumed while hashing, so they need an explicit
+                summary.
+        """
+        if not items:
+            return []
+
+        calldata: list[tuple[int, str, bytes]] = []
+        for block, summary, content in items:
+            # keccak256, matching the contract's own hashing — 32 bytes, no
+            # hex round-trip, and proof_hash is exact without reading logs
+            if summary is None and isinstance(content, dict):
+                # Fused pass: hash and first-140-bytes summary in one walk
+                content_hash, summary = _hash_and_summary(content)
+            else:
+                content_hash = _hash_content(content)
+                if summary is None:
+                    if isinstance(content, str):
+                        summary = truncate_summary(content)
+                    elif isinstance(content, bytes):
+                        summary = content[:SUMMARY_MAX_BYTES].decode("utf-8", errors="ignore")
+                    else:  # streamed chunks are gone after hashing — nothing to derive from
+                        raise ValueError(
+                            "summary is required when content is a chunk iterable"
+                        )
+            # Solidity string limits are byte-length — len() counts code
+            # points and lets emoji/CJK summaries through to a revert
+            summary_len = len(summary.encode("utf-8"))
+            if summary_len > SUMMARY_MAX_BYTES:
+                raise ValueError(
+                    f"summary must be ≤{SUMMARY_MAX_BYTES} UTF-8 bytes "
+                    f"(got {summary_len}) — see truncate_summary()"
+                )
+            calldata.append((_block_value(block), summary, content_hash))
+
+        return await self._submit_calldata(calldata)
+
+    async def _submit_calldata(self, calldata: list[tuple[int, str, bytes]]) -> list[InscribeResult]:
+        """Sign and batch-submit prepared (blockType, summary, contentHash) rows."""
+        await self._ensure_session()
+
+        first_data = self._sel_inscribe + abi_encode(_INSCRIBE_TYPES, calldata[0])
+        if self._gas_limit is None:
+            estimate = await self._w3.eth.estimate_gas({
+                "from": self._account.address,
+                "to":   self._contract.address,
+                "data": first_data,
+            })
+            self._gas_limit = int(estimate * 1.25)  # headroom for larger summaries
+
+        await self._get_chain_id()  # bind chainId for _pack_and_sign
+
+        for attempt in (0, 1):
+            nonce            = await self._next_nonce(count=len(calldata))
+            max_fee, max_tip = await self._current_fees()
+
+            raw_txs = []
+            for i, args in enumerate(calldata):
+                data = first_data if i == 0 else self._sel_inscribe + abi_encode(_INSCRIBE_TYPES, args)
+                # nonce incremented locally — no per-tx refetch
+                raw_txs.append(
+                    self._pack_and_sign(nonce + i, max_fee, max_tip, self._gas_limit, data)
+                )
+
+            # One JSON-RPC 2.0 batch POST straight through the provider —
+            # eth_sendRawTransaction is rejected by w3.batch_requests()
+            responses = await self._w3.provider.make_batch_request(
+                [("eth_sendRawTransaction", ["0x" + raw.hex()]) for raw in raw_txs]
+            )
+            if not isinstance(responses, list):  # transport-level error object
+                responses = [responses]
+            errored = [r for r in responses if "error" in r]
+            if errored:
+                if attempt == 0 and any("nonce too low" in str(r["error"]) for r in errored):
+                    self.invalidate_cache()  # another signer moved the nonce; resync once
+                    continue
+                raise Web3RPCError(str(errored[0]["error"]), rpc_response=errored[0])
+            tx_hashes = [HexBytes(r["result"]) for r in responses]
+            break
+
+        results = [
+            InscribeResult(
+                tx_hash=tx_hash.to_0x_hex(),
+                proof_hash="0x" + args[2].hex(),
+            )
+            for tx_hash, args in zip(tx_hashes, calldata)
+        ]
+
+        # Confirmation runs in the background — callers that need cycle_id
+        # await result.wait(); everyone else continues after ~1 RTT.
+        task = asyncio.get_running_loop().create_task(
+            self._confirm(list(tx_hashes), results)
+        )
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        for result in results:
+            result._confirm = task
+
+        return results
+
+    async def _confirm(self, tx_hashes: list, results: list[InscribeResult]) -> None:
+        """Wait for receipts of a submitted batch and fill in the cycle fields."""
+        try:
+            receipts = await asyncio.gather(*(
+                self._wait_for_receipt(h) for h in tx_hashes
+            ))
+            event = self._contract.events.CycleInscribed()
+            for result, receipt in zip(results, receipts):
+                # The contract emits everything we need — no extra eth_call
+                logs = event.process_receipt(receipt, errors=DISCARD)
+                if logs:
+                    args = logs[0]["args"]
+                    result.cycle_id      = args["cycleId"]
+                    result.proof_hash    = "0x" + args["proofHash"].hex()
+                    result.network_cycle = args["networkCycle"]
+                else:  # event shape drifted — keep the old block-number fallback
+                    result.cycle_id = receipt["blockNumber"]
+                result.pending = False
+        except Exception as e:
+            # This task runs in the background — unrecorded, a failure here is
+            # just a GC warning and fire-and-forget cycles vanish silently.
+            # Record it so wait() re-raises and callers can check .error.
+            for result in results:
+                result.error = e
+            logger.warning(
+                "cycle confirmation failed for %d tx(s): %s", len(results), e
+            )
+
+    async def inscribe_merkle(
+        self,
+        block:   BlockInput,
+        leaves:  list[bytes],
+        summary: Optional[str] = None,
+    ) -> MerkleInscribeResult:
+        """
+        Aggregate N cycle contents into one Merkle root and inscribe it in a
+        single tx — O(1) on-chain cost for a whole batch of cycles. Each leaf
+        stays individually verifiable via the returned proofs.
+        """
+        if len(leaves) >= _PARALLEL_LEAVES:
+            # big tree — keep the event loop responsive while it builds
+            root, proofs = await asyncio.get_running_loop().run_in_executor(
+                None, merkleize, leaves
+            )
+        else:
+            root, proofs = merkleize(leaves)
+        if summary is None:
+            summary = f"merkle batch — {len(leaves)} cycles"
+        results = await self._submit_calldata([(_block_value(block), summary, root)])
+        return MerkleInscribeResult(
+            root="0x" + root.hex(),
+            proofs=proofs,
+            inscription=results[0],
         )
 
+    async def inscribe_submit(
+        self,
+        block:   BlockInput,
+        summary: Optional[str],
+        content: Content,
+    ) -> tuple[str, "asyncio.Task"]:
+        """Fire an inscribe and return ``(tx_hash, confirmation_task)`` immediately."""
+        result = await self.inscribe(block=block, summary=summary, content=content)
+        return result.tx_hash, result._confirm
+
     async def attest(
         self,
         proof_hash: str,
         valid: bool = True,
     ) -> AttestResult:
         """Attest a previous cycle's proofHash (V5.2 epoch rewards)."""
+        await self._ensure_session()
+
         ph_bytes = bytes.fromhex(proof_hash.removeprefix("0x"))
         ph32     = ph_bytes.ljust(32, b"\x00")[:32]
 
-        nonce    = await self._w3.eth.get_transaction_count(self._account.address)
-        gas_price = await self._w3.eth.gas_price
-
-        tx = await self._contract.functions.attestProof(
-            self._agent_id, ph32, valid
-        ).build_transaction({
-            "from":     self._account.address,
-            "nonce":    nonce,
-            "gasPrice": gas_price,
+        data = self._sel_attest + abi_encode(_ATTEST_TYPES, (self._agent_id, ph32, valid))
+        await self._get_chain_id()  # bind chainId for _pack_and_sign
+        gas  = await self._w3.eth.estimate_gas({
+            "from": self._account.address,
+            "to":   self._contract.address,
+            "data": data,
         })
 
-        signed  = self._account.sign_transaction(tx)
-        tx_hash = await self._w3.eth.send_raw_transaction(signed.raw_transaction)
-        await self._w3.eth.wait_for_transaction_receipt(tx_hash)
+        for attempt in (0, 1):
+            max_fee, max_tip = await self._current_fees()
+            raw = self._pack_and_sign(await self._next_nonce(), max_fee, max_tip, gas, data)
+            try:
+                tx_hash = await self._w3.eth.send_raw_transaction(raw)
+                break
+            except Web3RPCError as e:
+                if attempt == 0 and "nonce too low" in str(e):
+                    self.invalidate_cache()
+                    continue
+                raise
 
-        return AttestResult(tx_hash=tx_hash.hex())
+        await self._wait_for_receipt(tx_hash)
+
+        return AttestResult(tx_hash=tx_hash.to_0x_hex())
 
     async def total_cycles(self) -> int:
         """Return total cycles inscribed on the network."""
+        await self._ensure_session()
         return await self._contract.functions.totalCycles().call()
 
     # ── Sync wrappers ──────────────────────────────────────────────────────────
 
-    def inscribe_sync(self, block: BlockType, summary: str, content: str) -> InscribeResult:
-        """Synchronous wrapper for inscribe() — use in non-async frameworks."""
-        return asyncio.run(self.inscribe(block=block, summary=summary, content=content))
+    def inscribe_sync(
+        self,
+        block:   BlockInput,
+        summary: Optional[str],
+        content: Content,
+        wait:    bool = True,
+    ) -> InscribeResult:
+        """
+        Synchronous wrapper for inscribe() — use in non-async frameworks.
+
+        With ``wait=False`` the call returns after submission (pending result);
+        confirmation still completes on the background loop.
+        """
+        async def _run() -> InscribeResult:
+            result = await self.inscribe(block=block, summary=summary, content=content)
+            return await result.wait() if wait else result
+
+        return asyncio.run_coroutine_threadsafe(_run(), self._loop).result()
+
+    def fire_and_forget(
+        self,
+        block:   BlockInput,
+        summary: Optional[str],
+        content: Content,
+    ) -> "Future[InscribeResult]":
+        """
+        Queue an inscribe on the background loop and return immediately —
+        submission and confirmation overlap whatever the caller does next.
+        The returned Future resolves to the (pending) InscribeResult; ignore
+        it for pure fire-and-forget use.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.inscribe(block=block, summary=summary, content=content), self._loop
+        )
 
     def attest_sync(self, proof_hash: str, valid: bool = True) -> AttestResult:
         """Synchronous wrapper for attest()."""
-        return asyncio.run(self.attest(proof_hash=proof_hash, valid=valid))
+        return asyncio.run_coroutine_threadsafe(
+            self.attest(proof_hash=proof_hash, valid=valid), self._loop
+        ).result()